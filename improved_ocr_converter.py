@@ -7,10 +7,14 @@ Converts scanned PDF files to clean, well-formatted Markdown with intelligent te
 import os
 import sys
 import argparse
+import hashlib
 import pathlib
+import asyncio
 import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Tuple
 import logging
 import subprocess
 
@@ -21,11 +25,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Run Tesseract single-threaded unless the user says otherwise; OpenMP threads
+# oversubscribe the CPU once pages are OCR'd in parallel. This must be set
+# before the Tesseract library is loaded.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
 try:
     import pymupdf4llm
     import fitz  # PyMuPDF
     import pytesseract
-    from PIL import Image, ImageEnhance, ImageFilter
+    from PIL import Image, ImageEnhance, ImageFilter, ImageStat
 except ImportError as e:
     logger.error(f"Required packages not found: {e}")
     logger.info("Installing required packages...")
@@ -33,21 +42,207 @@ except ImportError as e:
     import pymupdf4llm
     import fitz
     import pytesseract
-    from PIL import Image, ImageEnhance, ImageFilter
+    from PIL import Image, ImageEnhance, ImageFilter, ImageStat
+
+# tesserocr talks to the Tesseract C API directly and keeps the model loaded
+# between pages; fall back to the pytesseract CLI wrapper when it's missing
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+# Skip the inverted-image retry and the dictionary (dawg) lookups; they cost
+# recognition time and add little for clean printed scans
+TESSERACT_VARIABLES = {
+    'tessedit_do_invert': '0',
+    'load_system_dawg': 'F',
+    'load_freq_dawg': 'F',
+    'load_unambig_dawg': 'F',
+    'load_punc_dawg': 'F',
+    'load_number_dawg': 'F',
+    'load_bigram_dawg': 'F',
+}
+
+# Tesseract options shared by the pytesseract and batch CLI paths
+TESSERACT_CONFIG = '--psm 6 --oem 3 ' + ' '.join(f'-c {name}={value}' for name, value in TESSERACT_VARIABLES.items())
+
+# Bump when rendering or preprocessing changes, so cached OCR text is not reused
+OCR_CACHE_VERSION = 1
+
+# Pages handed to one tesseract process when tesserocr isn't available
+OCR_BATCH_PAGES = 8
+
+# Write buffer for the markdown output file
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Page borders left out of OCR renders, as fractions of the page size:
+# (left, top, right, bottom). Scans rarely carry content there, and the bands
+# mostly hold headers/footers that would be filtered out anyway.
+DEFAULT_OCR_MARGINS = (0.05, 0.04, 0.05, 0.06)
+
+# Pages whose embedded text layer is longer than this skip OCR
+MIN_NATIVE_CHARS = 100
+
+# Precompiled patterns for OCR artifact cleanup
+_WHITESPACE_RE = re.compile(r'\s+')
+_PIPE_UNDERSCORE_RUN_RE = re.compile(r'[|_]{2,}')
+# Pure noise only: control characters (except tab/newline/CR) and the
+# replacement/box glyphs emitted for unrecognised shapes. Real punctuation,
+# typographic quotes and symbols such as © € ° < > are kept.
+_INVALID_CHARS_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f\ufffd\u25a0\u25a1]')
+
+# Digits misread inside words ("B0OK", "fi1e"); digits next to other digits are left alone
+_ZERO_IN_WORD_RE = re.compile(r'(?<=[A-Za-z])0(?=[A-Za-z])')
+_ONE_IN_WORD_RE = re.compile(r'(?<=[A-Za-z])1(?=[A-Za-z])')
+
+# Heading candidates: roman numeral or numbered sections, or a capitalized word
+_HEADING_RE = re.compile(r'^(?:[IVX]+\.|\d+\.|[A-Z][a-z]+)')
+
+# Line endings that close a sentence for paragraph merging
+_SENTENCE_ENDINGS = ('.', '!', '?', ':')
+
+
+# Tesseract API preloaded by _init_ocr_worker, shared by every task in a pool worker
+_API = None
+
+
+def _create_tesseract_api():
+    """Create a tesserocr API configured like the pytesseract and CLI paths"""
+    return tesserocr.PyTessBaseAPI(
+        lang='eng',
+        psm=tesserocr.PSM.SINGLE_BLOCK,
+        oem=tesserocr.OEM.DEFAULT,
+        variables=TESSERACT_VARIABLES
+    )
+
+
+def _init_ocr_worker():
+    """Prepare a pool worker process for OCR"""
+    global _API
+    
+    # Each worker already OCRs its own page, so letting Tesseract spawn
+    # OpenMP threads on top of that only oversubscribes the CPU
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+    
+    # Load the language model once per worker instead of once per task
+    if tesserocr is not None:
+        _API = _create_tesseract_api()
+
+
+def _iter_paragraphs(lines: Iterable[str]) -> Iterator[str]:
+    """Strip lines, drop empty ones and merge the rest into paragraphs"""
+    # This loop runs once per line of every page, so attribute lookups are hoisted
+    # into locals and the previous line's ending is tracked instead of re-checked
+    current_paragraph = []
+    append = current_paragraph.append
+    clear = current_paragraph.clear
+    join = ' '.join
+    sentence_endings = _SENTENCE_ENDINGS
+    previous_ends_sentence = True  # Nothing to break away from before the first line
+    
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        
+        # If line starts with uppercase and previous line doesn't end with sentence ending
+        if not previous_ends_sentence and line[0].isupper():
+            # Start new paragraph
+            yield join(current_paragraph)
+            clear()
+        
+        append(line)
+        previous_ends_sentence = line.endswith(sentence_endings)
+    
+    # Add the last paragraph
+    if current_paragraph:
+        yield join(current_paragraph)
+
+
+def _pdf_fingerprint(pdf_path: str) -> str:
+    """Hash a PDF's size and leading/trailing bytes into a cache key component"""
+    # The head holds the document header and the tail holds the trailer, /ID
+    # and xref offsets, which change whenever the content does
+    sample_size = 1 << 20
+    digest = hashlib.blake2b(digest_size=20)
+    with open(pdf_path, 'rb') as f:
+        size = f.seek(0, os.SEEK_END)
+        digest.update(str(size).encode('ascii'))
+        f.seek(0)
+        digest.update(f.read(sample_size))
+        if size > sample_size:
+            f.seek(max(sample_size, size - sample_size))
+            digest.update(f.read(sample_size))
+    return digest.hexdigest()
+
+
+def _encode_markdown_lines(lines: Iterable[str]) -> bytes:
+    """Join markdown lines, each newline-terminated, into UTF-8 bytes"""
+    return ''.join(line + '\n' for line in lines).encode('utf-8')
+
+
+def _format_structure_line(line: str) -> str:
+    """Format a stripped, non-empty line as a markdown heading or paragraph"""
+    # Detect headings (lines that are short, all caps, or end with numbers):
+    # short all-caps lines become ##, other headings ###, the rest stay paragraphs
+    if len(line) < 100 and (line.isupper() or _HEADING_RE.match(line)):
+        return f"## {line}" if line.isupper() and len(line) < 50 else f"### {line}"
+    return line
+
 
 class ImprovedOCRConverter:
     """Improved OCR-enabled PDF to Markdown converter with intelligent text processing"""
     
-    def __init__(self, output_dir: str = "improved_output", image_dir: str = "improved_images"):
+    # Common single-character OCR mistakes, fixed in one pass
+    _OCR_TRANS = str.maketrans({'|': 'I'})
+    
+    def __init__(
+        self,
+        output_dir: str = "improved_output",
+        image_dir: str = "improved_images",
+        save_images: bool = False,
+        force_ocr: bool = False,
+        use_cache: bool = True,
+        cache_dir: Optional[str] = None,
+        margins: Tuple[float, float, float, float] = DEFAULT_OCR_MARGINS,
+        workers: Optional[int] = None
+    ):
         """
         Initialize the improved OCR converter
         
         Args:
             output_dir: Directory for output markdown files
             image_dir: Directory for extracted images
+            save_images: Also write each rendered page to image_dir as PNG
+            force_ocr: OCR every page, even those with an embedded text layer
+            use_cache: Reuse raw OCR text from earlier runs on the same PDF
+            cache_dir: Directory for cached OCR text (default: ~/.cache/pdf2md_ocr)
+            margins: Page borders to skip when rendering for OCR, as fractions
+                of the page size (left, top, right, bottom)
+            workers: Number of OCR worker processes (default: CPU count, up to 4)
         """
+        left, top, right, bottom = margins
+        if min(margins) < 0 or left + right >= 1 or top + bottom >= 1:
+            raise ValueError(f"Invalid OCR margins {margins}: must be non-negative and leave part of the page")
+        
         self.output_dir = Path(output_dir)
         self.image_dir = Path(image_dir)
+        self.save_images = save_images
+        self.force_ocr = force_ocr
+        self.margins = tuple(margins)
+        self.use_cache = use_cache
+        self.cache_dir = Path(cache_dir) if cache_dir else Path.home() / ".cache" / "pdf2md_ocr"
+        self._pdf_cache_keys = {}  # (PDF path, size, mtime) -> content fingerprint
+        self._tesseract_version = None
+        self._api = None  # Lazily created tesserocr API, reused across pages
+        
+        # One worker pool for the converter's lifetime, so converting many PDFs
+        # doesn't pay for process start-up and Tesseract model loading each time.
+        # Workers are only started on first use; close() shuts them down.
+        self.workers = workers if workers is not None else min(os.cpu_count() or 1, 4)
+        self._pool = None
+        if self.workers > 1:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_ocr_worker)
         self.setup_directories()
         
         # Configure Tesseract path for macOS
@@ -77,44 +272,149 @@ class ImprovedOCRConverter:
             r'preview'
         ]
         
+        # Single alternation of all header/footer patterns, scanned once per line
+        self._hf_re = re.compile("|".join(f"(?:{p})" for p in self.headers_footers))
+        
+    def __getstate__(self):
+        # The Tesseract API handle and the pool can't be pickled; worker processes
+        # use their own preloaded API and never start nested pools
+        state = self.__dict__.copy()
+        state['_api'] = None
+        state['_pool'] = None
+        return state
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def __del__(self):
+        pool = getattr(self, '_pool', None)
+        if pool is not None:
+            pool.shutdown(wait=False)
+            self._pool = None
+        
+        api = getattr(self, '_api', None)
+        if api is not None:
+            api.End()
+            self._api = None
+    
+    def close(self):
+        """Shut down the OCR worker processes and release the Tesseract API"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        
+        if self._api is not None:
+            self._api.End()
+            self._api = None
+    
     def setup_directories(self):
         """Create necessary directories if they don't exist"""
         self.output_dir.mkdir(exist_ok=True)
-        self.image_dir.mkdir(exist_ok=True)
         logger.info(f"Output directory: {self.output_dir.absolute()}")
-        logger.info(f"Image directory: {self.image_dir.absolute()}")
+        if self.save_images:
+            self.image_dir.mkdir(exist_ok=True)
+            logger.info(f"Image directory: {self.image_dir.absolute()}")
     
-    def preprocess_image_for_ocr(self, image_path: str) -> Image.Image:
+    def preprocess_image_for_ocr(self, image: Image.Image, dpi: int = 200) -> Image.Image:
         """
         Preprocess image to improve OCR accuracy and remove watermarks
         
         Args:
-            image_path: Path to the image file
+            image: Rendered page image
+            dpi: Resolution the image was rendered at
             
         Returns:
             Preprocessed PIL Image
         """
-        # Open image
-        image = Image.open(image_path)
+        contrast = 1.5  # Enhance contrast to reduce watermark interference
+        sharpness = 1.3
+        
+        if image.mode == 'L':
+            # Contrast and sharpness enhancement are both linear, so apply them
+            # as one 3x3 convolution instead of two full-image passes:
+            #   contrast:  mean + c * (x - mean)
+            #   sharpness: smooth(x) + s * (x - smooth(x)), smooth = ImageFilter.SMOOTH
+            mean = int(ImageStat.Stat(image).mean[0] + 0.5)
+            edge = -contrast * (sharpness - 1) / 13
+            kernel = [edge] * 9
+            kernel[4] = contrast * sharpness - contrast * (sharpness - 1) * 5 / 13
+            image = image.filter(ImageFilter.Kernel((3, 3), kernel, scale=1, offset=mean * (1 - contrast)))
+        else:
+            image = ImageEnhance.Contrast(image).enhance(contrast)
+            image = ImageEnhance.Sharpness(image).enhance(sharpness)
+        
+        # Denoise only high-resolution grayscale renders, where a 3x3 window
+        # is small relative to the strokes and won't erode the text
+        if dpi >= 300 and image.mode == 'L':
+            image = image.filter(ImageFilter.MedianFilter(size=3))
+        
+        return image
+    
+    def run_tesseract(self, image: Image.Image) -> str:
+        """
+        Run Tesseract on a preprocessed image
         
-        # Convert to RGB if necessary
-        if image.mode != 'RGB':
-            image = image.convert('RGB')
+        Args:
+            image: Preprocessed PIL Image
+            
+        Returns:
+            Raw OCR text
+        """
+        if tesserocr is None:
+            return pytesseract.image_to_string(
+                image,
+                lang='eng',
+                config=TESSERACT_CONFIG
+            )
         
-        # Enhance contrast to reduce watermark interference
-        enhancer = ImageEnhance.Contrast(image)
-        image = enhancer.enhance(1.5)
+        # Inside a pool worker, reuse the API loaded by the worker initializer
+        api = _API
+        if api is None:
+            if self._api is None:
+                self._api = _create_tesseract_api()
+            api = self._api
         
-        # Enhance sharpness
-        enhancer = ImageEnhance.Sharpness(image)
-        image = enhancer.enhance(1.3)
+        api.SetImage(image)
+        return api.GetUTF8Text()
+    
+    def run_tesseract_batch(self, image_paths: List[Path]) -> List[str]:
+        """
+        Run a single tesseract process over several image files
         
-        # Apply slight blur to reduce noise while preserving text
-        image = image.filter(ImageFilter.MedianFilter(size=1))
+        Args:
+            image_paths: Preprocessed page images, in page order
+            
+        Returns:
+            Raw OCR text for each image
+        """
+        work_dir = image_paths[0].parent
+        file_list = work_dir / "pages.txt"
+        file_list.write_text('\n'.join(str(p.absolute()) for p in image_paths) + '\n', encoding='utf-8')
+        output_base = work_dir / "ocr"
         
-        return image
+        subprocess.run(
+            [
+                pytesseract.pytesseract.tesseract_cmd,
+                str(file_list),
+                str(output_base),
+                '-l', 'eng',
+                *TESSERACT_CONFIG.split()
+            ],
+            check=True,
+            capture_output=True
+        )
+        
+        # Tesseract ends every page of multi-image output with a form feed
+        output = Path(f"{output_base}.txt").read_text(encoding='utf-8')
+        texts = output.split('\x0c')[:len(image_paths)]
+        if len(texts) != len(image_paths):
+            raise RuntimeError(f"Expected OCR output for {len(image_paths)} pages, got {len(texts)}")
+        return texts
     
-    def extract_page_with_improved_ocr(self, pdf_path: str, page_num: int, dpi: int = 300) -> Dict[str, Any]:
+    def extract_page_with_improved_ocr(self, pdf_path: str, page_num: int, dpi: int = 200) -> Dict[str, Any]:
         """
         Extract a single page with improved OCR text extraction
         
@@ -129,59 +429,441 @@ class ImprovedOCRConverter:
         pdf_path = Path(pdf_path)
         doc = fitz.open(str(pdf_path))
         
-        if page_num >= len(doc):
-            raise ValueError(f"Page {page_num} does not exist. PDF has {len(doc)} pages.")
+        try:
+            if page_num >= len(doc):
+                raise ValueError(f"Page {page_num} does not exist. PDF has {len(doc)} pages.")
+            
+            return self.extract_page(doc[page_num], pdf_path.stem, dpi)
+        finally:
+            doc.close()
+    
+    def extract_pages(self, pdf_path: str, page_nums: List[int], dpi: int = 200) -> List[Dict[str, Any]]:
+        """
+        Extract several pages, opening the PDF only once
         
-        page = doc[page_num]
+        Args:
+            pdf_path: Path to the input PDF file
+            page_nums: Page numbers to extract (0-based)
+            dpi: Resolution for extracted images
+            
+        Returns:
+            List of page data dictionaries, in the order of page_nums
+        """
+        pdf_path = Path(pdf_path)
+        doc = fitz.open(str(pdf_path))
         
-        # Create high-quality image
-        mat = fitz.Matrix(dpi/72, dpi/72)  # Convert DPI to scale factor
-        pix = page.get_pixmap(matrix=mat)
+        try:
+            extracted_data = []
+            for i in range(0, len(page_nums), OCR_BATCH_PAGES):
+                batch = page_nums[i:i + OCR_BATCH_PAGES]
+                extracted_data.extend(self.extract_page_batch(doc, pdf_path.stem, batch, dpi))
+            return extracted_data
+        finally:
+            doc.close()
+    
+    def extract_page_batch(
+        self,
+        doc: fitz.Document,
+        pdf_stem: str,
+        page_nums: List[int],
+        dpi: int = 200
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract a batch of pages of an already opened PDF with improved OCR
+        
+        Without tesserocr, the pages that need OCR are recognised by a single
+        tesseract process so the language model is loaded once per batch, not per page.
         
-        # Save image
-        image_filename = f"{pdf_path.stem}-page-{page_num:03d}.png"
-        image_path = self.image_dir / image_filename
-        pix.save(str(image_path))
+        Args:
+            doc: Open PDF document
+            pdf_stem: PDF file name without extension, used for image names
+            page_nums: Page numbers to extract (0-based)
+            dpi: Resolution for extracted images
+            
+        Returns:
+            List of page data dictionaries, in the order of page_nums
+        """
+        extracted_data = [None] * len(page_nums)
+        
+        # Pages with a usable text layer or cached OCR text never reach Tesseract
+        ocr_jobs = []
+        for index, page_num in enumerate(page_nums):
+            page = doc[page_num]
+            native_text = page.get_text().strip()
+            if self.has_text_layer(native_text):
+                extracted_data[index] = self._build_text_layer_page_data(page, native_text)
+                continue
+            
+            cache_path = self._ocr_cache_path(page, dpi)
+            cached_data = self._build_cached_page_data(page, pdf_stem, dpi, native_text, cache_path)
+            if cached_data is not None:
+                extracted_data[index] = cached_data
+            else:
+                ocr_jobs.append((index, page, native_text, cache_path))
+        
+        if tesserocr is not None or len(ocr_jobs) <= 1:
+            page_data = self._run_ocr_pipeline(ocr_jobs, pdf_stem, dpi) if ocr_jobs else []
+            for job, data in zip(ocr_jobs, page_data):
+                extracted_data[job[0]] = data
+            return extracted_data
+        
+        rendered = []
+        with tempfile.TemporaryDirectory(prefix='pdf2md-ocr-') as tmp_dir:
+            ocr_image_paths = []
+            for index, page, native_text, cache_path in ocr_jobs:
+                image, image_path, image_filename = self.render_page(page, pdf_stem, dpi)
+                rendered.append((image_path, image_filename))
+                
+                # Uncompressed PGM is cheap to write and read compared to PNG
+                ocr_image_path = Path(tmp_dir) / f"page-{page.number:05d}.pgm"
+                self.preprocess_image_for_ocr(image, dpi).save(ocr_image_path)
+                ocr_image_paths.append(ocr_image_path)
+            
+            page_labels = ', '.join(str(job[1].number + 1) for job in ocr_jobs)
+            logger.info(f"Running improved OCR on pages {page_labels}...")
+            try:
+                ocr_texts = self.run_tesseract_batch(ocr_image_paths)
+                for job, ocr_text in zip(ocr_jobs, ocr_texts):
+                    self._store_cached_ocr(job[3], ocr_text)
+            except Exception as e:
+                logger.error(f"OCR failed for pages {page_labels}: {e}")
+                ocr_texts = [""] * len(ocr_jobs)
+        
+        for (index, page, native_text, _), (image_path, image_filename), ocr_text in zip(ocr_jobs, rendered, ocr_texts):
+            extracted_data[index] = self._build_page_data(page.number, image_path, image_filename, ocr_text, native_text)
+        
+        return extracted_data
+    
+    def _run_ocr_pipeline(self, ocr_jobs: List[tuple], pdf_stem: str, dpi: int) -> List[Dict[str, Any]]:
+        """Run _ocr_pipeline to completion from synchronous code"""
+        pipeline = self._ocr_pipeline(ocr_jobs, pdf_stem, dpi)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(pipeline)
+        
+        # Already inside an event loop (e.g. a notebook): run ours on a helper thread
+        with ThreadPoolExecutor(max_workers=1) as runner:
+            return runner.submit(asyncio.run, pipeline).result()
+    
+    async def _ocr_pipeline(self, ocr_jobs: List[tuple], pdf_stem: str, dpi: int) -> List[Dict[str, Any]]:
+        """
+        OCR pages through a render -> preprocess -> OCR -> clean pipeline
+        
+        Each stage runs on its own thread, with small bounded queues between
+        them, so while one page is being OCR'd the next is rendered and
+        preprocessed and the previous one cleaned. Tesseract and PyMuPDF
+        release the GIL for most of their work, so the stages really overlap.
+        
+        Returns:
+            Page data dictionaries, in the order of ocr_jobs
+        """
+        loop = asyncio.get_running_loop()
+        
+        # Read page numbers up front: only the render stage touches PyMuPDF objects afterwards
+        items = [
+            {'page': page, 'page_num': page.number, 'native_text': native_text, 'cache_path': cache_path, 'error': None}
+            for _, page, native_text, cache_path in ocr_jobs
+        ]
+        results = [None] * len(items)
+        
+        rendered = asyncio.Queue(maxsize=2)
+        preprocessed = asyncio.Queue(maxsize=2)
+        recognised = asyncio.Queue(maxsize=2)
+        
+        async def render(executor):
+            for item in items:
+                try:
+                    item['image'], item['image_path'], item['image_filename'] = await loop.run_in_executor(
+                        executor, self.render_page, item['page'], pdf_stem, dpi
+                    )
+                except Exception as e:
+                    item['image_path'] = item['image_filename'] = None
+                    item['error'] = e
+                await rendered.put(item)
+            await rendered.put(None)
+        
+        async def preprocess(executor):
+            while (item := await rendered.get()) is not None:
+                if item['error'] is None:
+                    try:
+                        item['image'] = await loop.run_in_executor(
+                            executor, self.preprocess_image_for_ocr, item['image'], dpi
+                        )
+                    except Exception as e:
+                        item['error'] = e
+                await preprocessed.put(item)
+            await preprocessed.put(None)
+        
+        async def ocr(executor):
+            while (item := await preprocessed.get()) is not None:
+                page_num = item['page_num']
+                
+                # Extract text using improved OCR
+                logger.info(f"Running improved OCR on page {page_num + 1}...")
+                try:
+                    if item['error'] is not None:
+                        raise item['error']
+                    item['ocr_text'] = await loop.run_in_executor(executor, self.run_tesseract, item.pop('image'))
+                    self._store_cached_ocr(item['cache_path'], item['ocr_text'])
+                except Exception as e:
+                    logger.error(f"OCR failed for page {page_num + 1}: {e}")
+                    item['ocr_text'] = ""
+                await recognised.put(item)
+            await recognised.put(None)
+        
+        async def clean(executor):
+            index = 0
+            while (item := await recognised.get()) is not None:
+                results[index] = await loop.run_in_executor(
+                    executor,
+                    self._build_page_data,
+                    item['page_num'],
+                    item['image_path'],
+                    item['image_filename'],
+                    item['ocr_text'],
+                    item['native_text']
+                )
+                index += 1
+        
+        stages = (render, preprocess, ocr, clean)
+        executors = [ThreadPoolExecutor(max_workers=1) for _ in stages]
+        try:
+            await asyncio.gather(*(stage(executor) for stage, executor in zip(stages, executors)))
+        finally:
+            for executor in executors:
+                executor.shutdown(wait=True)
+        
+        return results
+    
+    def extract_page(self, page: fitz.Page, pdf_stem: str, dpi: int = 200) -> Dict[str, Any]:
+        """
+        Extract a single page of an already opened PDF with improved OCR
+        
+        Args:
+            page: Page of an open PDF document
+            pdf_stem: PDF file name without extension, used for image names
+            dpi: Resolution for extracted images
+            
+        Returns:
+            Dictionary containing page data
+        """
+        # Born-digital or already OCR'd pages carry a text layer that is both
+        # faster and more accurate than running Tesseract
+        native_text = page.get_text().strip()
+        if self.has_text_layer(native_text):
+            return self._build_text_layer_page_data(page, native_text)
+        
+        cache_path = self._ocr_cache_path(page, dpi)
+        cached_data = self._build_cached_page_data(page, pdf_stem, dpi, native_text, cache_path)
+        if cached_data is not None:
+            return cached_data
+        
+        return self._ocr_page(page, pdf_stem, dpi, native_text, cache_path)
+    
+    def has_text_layer(self, native_text: str) -> bool:
+        """
+        Check whether a page's embedded text is good enough to skip OCR
+        
+        Args:
+            native_text: Stripped text extracted by PyMuPDF
+            
+        Returns:
+            True if OCR can be skipped for the page
+        """
+        return not self.force_ocr and len(native_text) > MIN_NATIVE_CHARS
+    
+    def _ocr_page(
+        self,
+        page: fitz.Page,
+        pdf_stem: str,
+        dpi: int,
+        native_text: str,
+        cache_path: Optional[Path] = None
+    ) -> Dict[str, Any]:
+        """Render and OCR a single page"""
+        image, image_path, image_filename = self.render_page(page, pdf_stem, dpi)
         
         # Extract text using improved OCR
-        logger.info(f"Running improved OCR on page {page_num + 1}...")
+        logger.info(f"Running improved OCR on page {page.number + 1}...")
         try:
             # Preprocess image
-            preprocessed_image = self.preprocess_image_for_ocr(str(image_path))
+            preprocessed_image = self.preprocess_image_for_ocr(image, dpi)
             
             # Run OCR with optimized parameters
-            ocr_text = pytesseract.image_to_string(
-                preprocessed_image, 
-                lang='eng',
-                config='--psm 6 --oem 3'
-            )
+            ocr_text = self.run_tesseract(preprocessed_image)
+            self._store_cached_ocr(cache_path, ocr_text)
             
-            # Clean and process the OCR text
-            cleaned_text = self.clean_and_format_ocr_text(ocr_text)
+        except Exception as e:
+            logger.error(f"OCR failed for page {page.number + 1}: {e}")
+            ocr_text = ""
+        
+        return self._build_page_data(page.number, image_path, image_filename, ocr_text, native_text)
+    
+    def _ocr_cache_path(self, page: fitz.Page, dpi: int) -> Optional[Path]:
+        """
+        Locate the cache file for a page's raw OCR text
+        
+        The key covers the PDF content, page, DPI and everything about the OCR
+        engine that can change its output, so stale text is never reused.
+        Returns None when caching is disabled or the PDF has no file on disk.
+        """
+        if not self.use_cache or not page.parent.name:
+            return None
+        
+        # The memo is keyed on size and mtime too, so a file replaced at the same
+        # path (or a stale copy of the memo in a worker) is fingerprinted afresh
+        pdf_path = page.parent.name
+        stat = os.stat(pdf_path)
+        memo_key = (pdf_path, stat.st_size, stat.st_mtime_ns)
+        if memo_key not in self._pdf_cache_keys:
+            self._pdf_cache_keys[memo_key] = _pdf_fingerprint(pdf_path)
+        
+        if self._tesseract_version is None:
+            try:
+                if tesserocr is not None:
+                    self._tesseract_version = f"tesserocr-{tesserocr.tesseract_version()}"
+                else:
+                    self._tesseract_version = f"cli-{pytesseract.get_tesseract_version()}"
+            except Exception:
+                # OCR will fail too, so nothing gets cached under this key
+                self._tesseract_version = "unknown"
+        
+        key_parts = [
+            OCR_CACHE_VERSION,
+            self._pdf_cache_keys[memo_key],
+            page.number,
+            dpi,
+            self.margins,
+            self._tesseract_version,
+            TESSERACT_CONFIG
+        ]
+        key = hashlib.blake2b('|'.join(map(str, key_parts)).encode('utf-8'), digest_size=20).hexdigest()
+        return self.cache_dir / f"{key}.txt"
+    
+    def _build_cached_page_data(
+        self,
+        page: fitz.Page,
+        pdf_stem: str,
+        dpi: int,
+        native_text: str,
+        cache_path: Optional[Path]
+    ) -> Optional[Dict[str, Any]]:
+        """Assemble page data from cached OCR text, or return None on a cache miss"""
+        if cache_path is None or not cache_path.exists():
+            return None
+        
+        logger.info(f"Page {page.number + 1}: using cached OCR text")
+        ocr_text = cache_path.read_text(encoding='utf-8')
+        
+        # The page image is only needed when the user asked for it
+        image_path = image_filename = None
+        if self.save_images:
+            _, image_path, image_filename = self.render_page(page, pdf_stem, dpi)
+        
+        return self._build_page_data(page.number, image_path, image_filename, ocr_text, native_text)
+    
+    def _store_cached_ocr(self, cache_path: Optional[Path], ocr_text: str):
+        """Save raw OCR text to the cache; failures only cost a future re-OCR"""
+        if cache_path is None:
+            return
+        
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so parallel workers never read a partial file
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(ocr_text, encoding='utf-8')
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write OCR cache file {cache_path}: {e}")
+    
+    def render_page(self, page: fitz.Page, pdf_stem: str, dpi: int = 200):
+        """
+        Render a page to a grayscale image, saving it as PNG if requested
+        
+        Args:
+            page: Page of an open PDF document
+            pdf_stem: PDF file name without extension, used for image names
+            dpi: Resolution for extracted images
             
+        Returns:
+            Tuple of (PIL Image, saved image path or None, image filename or None)
+        """
+        # Create high-quality image
+        mat = fitz.Matrix(dpi/72, dpi/72)  # Convert DPI to scale factor
+        
+        # Leave out the page borders, so Tesseract gets fewer pixels at the same DPI
+        rect = page.rect
+        left, top, right, bottom = self.margins
+        clip = fitz.Rect(
+            rect.x0 + rect.width * left,
+            rect.y0 + rect.height * top,
+            rect.x1 - rect.width * right,
+            rect.y1 - rect.height * bottom
+        )
+        
+        # Render in grayscale: Tesseract works on luminance anyway, so color channels only add pixels
+        pix = page.get_pixmap(matrix=mat, clip=clip, colorspace=fitz.csGRAY, alpha=False)
+        
+        # Wrap the pixmap samples directly instead of round-tripping through a PNG file
+        image = Image.frombytes("L", (pix.width, pix.height), pix.samples)
+        
+        # Save image only when the PNG artifact is wanted
+        image_filename = None
+        image_path = None
+        if self.save_images:
+            image_filename = f"{pdf_stem}-page-{page.number:03d}.png"
+            image_path = self.image_dir / image_filename
+            # The saved page is the whole page; only the OCR input skips the margins
+            if any(self.margins):
+                pix = page.get_pixmap(matrix=mat, colorspace=fitz.csGRAY, alpha=False)
+            pix.save(str(image_path))
+        
+        return image, image_path, image_filename
+    
+    def _build_page_data(
+        self,
+        page_num: int,
+        image_path: Optional[Path],
+        image_filename: Optional[str],
+        ocr_text: str,
+        native_text: str
+    ) -> Dict[str, Any]:
+        """Clean the raw OCR text of a page and assemble its page data"""
+        # Clean and process the OCR text
+        cleaned_text = self.clean_and_format_ocr_text(ocr_text)
+        if cleaned_text:
             logger.info(f"Page {page_num + 1}: OCR extracted {len(cleaned_text)} characters")
             logger.info(f"Page {page_num + 1}: OCR preview: {cleaned_text[:100]}...")
-            
-        except Exception as e:
-            logger.error(f"OCR failed for page {page_num + 1}: {e}")
-            cleaned_text = ""
-        
-        # Try to get any native text (though likely none for scanned docs)
-        native_text = page.get_text().strip()
         
         extracted_data = {
             'page_num': page_num,
-            'image_path': str(image_path),
+            'image_path': str(image_path) if image_path else None,
             'image_filename': image_filename,
             'ocr_text': cleaned_text,
             'native_text': native_text,
             'has_text': bool(cleaned_text.strip() or native_text.strip())
         }
         
-        pix = None
-        doc.close()
         return extracted_data
     
+    def _build_text_layer_page_data(self, page: fitz.Page, native_text: str) -> Dict[str, Any]:
+        """Assemble page data from the embedded text layer, without OCR"""
+        page_num = page.number
+        
+        # Native text has no OCR artifacts, so only headers/footers and layout need fixing
+        cleaned_text = self.normalize_text_formatting(self.remove_headers_footers(native_text))
+        logger.info(f"Page {page_num + 1}: using embedded text layer ({len(cleaned_text)} characters)")
+        
+        return {
+            'page_num': page_num,
+            'image_path': None,
+            'image_filename': None,
+            'ocr_text': cleaned_text,
+            'native_text': native_text,
+            'has_text': bool(cleaned_text.strip() or native_text)
+        }
+    
     def clean_and_format_ocr_text(self, text: str) -> str:
         """
         Clean and format OCR-extracted text with intelligent processing
@@ -195,19 +877,43 @@ class ImprovedOCRConverter:
         if not text:
             return ""
         
+        return '\n\n'.join(self._process_lines(text.splitlines()))
+    
+    def _process_lines(self, lines: Iterable[str]) -> Iterator[str]:
+        """
+        Run the whole text cleaning pipeline in a single pass over the lines
+        
+        Each line is filtered for headers/footers, cleaned of OCR artifacts,
+        merged into paragraphs and tagged as heading or paragraph without
+        materialising the intermediate text between steps.
+        """
         # Remove headers and footers
-        text = self.remove_headers_footers(text)
+        lines = (line for line in lines if self._is_content_line(line))
         
         # Clean up common OCR artifacts
-        text = self.clean_ocr_artifacts(text)
+        lines = (self.clean_ocr_artifacts(line) for line in lines)
+        
+        # Normalize whitespace and line breaks, then detect and format headings
+        for paragraph in _iter_paragraphs(lines):
+            yield _format_structure_line(paragraph)
+    
+    def _is_content_line(self, line: str) -> bool:
+        """Check that a line is neither a header/footer nor noise"""
+        line = line.strip()
         
-        # Normalize whitespace and line breaks
-        text = self.normalize_text_formatting(text)
+        # Skip lines that match header/footer patterns
+        if self._hf_re.search(line.lower()):
+            return False
         
-        # Detect and format headings, lists, etc.
-        text = self.detect_and_format_structure(text)
+        # Skip very short lines that are likely noise
+        if len(line) < 3:
+            return False
         
-        return text
+        # Skip lines that are all numbers or special characters
+        if line.isdigit() or not any(c.isalpha() for c in line):
+            return False
+        
+        return True
     
     def remove_headers_footers(self, text: str) -> str:
         """
@@ -219,31 +925,7 @@ class ImprovedOCRConverter:
         Returns:
             Text with headers/footers removed
         """
-        lines = text.split('\n')
-        cleaned_lines = []
-        
-        for line in lines:
-            line_lower = line.lower().strip()
-            
-            # Skip lines that match header/footer patterns
-            skip_line = False
-            for pattern in self.headers_footers:
-                if re.search(pattern, line_lower):
-                    skip_line = True
-                    break
-            
-            # Skip very short lines that are likely noise
-            if len(line.strip()) < 3:
-                continue
-                
-            # Skip lines that are all numbers or special characters
-            if line.strip().isdigit() or not any(c.isalpha() for c in line.strip()):
-                continue
-            
-            if not skip_line:
-                cleaned_lines.append(line)
-        
-        return '\n'.join(cleaned_lines)
+        return '\n'.join(line for line in text.splitlines() if self._is_content_line(line))
     
     def clean_ocr_artifacts(self, text: str) -> str:
         """
@@ -255,17 +937,17 @@ class ImprovedOCRConverter:
         Returns:
             Cleaned text
         """
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
         # Remove common OCR artifacts
-        text = re.sub(r'[|_]{2,}', '', text)  # Remove excessive pipes/underscores
-        text = re.sub(r'[^\w\s.,;:!?()[]{}\'"\-–—…•·]', '', text)  # Keep only valid characters
+        text = _PIPE_UNDERSCORE_RUN_RE.sub('', text)  # Remove excessive pipes/underscores
+        text = _INVALID_CHARS_RE.sub('', text)  # Remove control characters and garbage glyphs
+        
+        # Remove excessive whitespace, including gaps left by the removals above
+        text = _WHITESPACE_RE.sub(' ', text)
         
         # Fix common OCR mistakes
-        text = text.replace('|', 'I')  # Common OCR mistake
-        text = text.replace('0', 'O')  # In certain contexts
-        text = text.replace('1', 'l')  # In certain contexts
+        text = text.translate(self._OCR_TRANS)
+        text = _ZERO_IN_WORD_RE.sub('O', text)
+        text = _ONE_IN_WORD_RE.sub('l', text)
         
         return text
     
@@ -279,30 +961,7 @@ class ImprovedOCRConverter:
         Returns:
             Normalized text
         """
-        # Split into lines and clean each line
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
-        
-        # Join lines intelligently
-        normalized_lines = []
-        current_paragraph = []
-        
-        for line in lines:
-            # If line starts with uppercase and previous line doesn't end with sentence ending
-            if (line and line[0].isupper() and 
-                current_paragraph and 
-                not current_paragraph[-1].endswith(('.', '!', '?', ':'))):
-                # Start new paragraph
-                if current_paragraph:
-                    normalized_lines.append(' '.join(current_paragraph))
-                    current_paragraph = []
-            
-            current_paragraph.append(line)
-        
-        # Add the last paragraph
-        if current_paragraph:
-            normalized_lines.append(' '.join(current_paragraph))
-        
-        return '\n\n'.join(normalized_lines)
+        return '\n\n'.join(_iter_paragraphs(text.splitlines()))
     
     def detect_and_format_structure(self, text: str) -> str:
         """
@@ -314,29 +973,11 @@ class ImprovedOCRConverter:
         Returns:
             Text with markdown formatting
         """
-        lines = text.split('\n')
-        formatted_lines = []
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            
-            # Detect headings (lines that are short, all caps, or end with numbers)
-            if (len(line) < 100 and 
-                (line.isupper() or 
-                 re.match(r'^[IVX]+\.', line) or
-                 re.match(r'^\d+\.', line) or
-                 re.match(r'^[A-Z][a-z]+', line))):
-                
-                # Format as heading
-                if line.isupper() and len(line) < 50:
-                    formatted_lines.append(f"## {line}")
-                else:
-                    formatted_lines.append(f"### {line}")
-            else:
-                # Regular paragraph
-                formatted_lines.append(line)
+        formatted_lines = [
+            _format_structure_line(line)
+            for line in map(str.strip, text.splitlines())
+            if line
+        ]
         
         return '\n\n'.join(formatted_lines)
     
@@ -351,38 +992,81 @@ class ImprovedOCRConverter:
         Returns:
             Clean markdown text
         """
-        md_content = []
-        
+        return '\n'.join(self._iter_markdown(extracted_data, pdf_name))
+    
+    def _iter_markdown(self, extracted_data: Iterable[Dict[str, Any]], pdf_name: str) -> Iterator[str]:
+        """Yield the markdown document line by line"""
+        yield from self._iter_markdown_header(pdf_name)
+        for page_data in extracted_data:
+            yield from self._iter_page_markdown(page_data)
+    
+    def _iter_markdown_header(self, pdf_name: str) -> Iterator[str]:
+        """Yield the document title lines"""
         # Simple header
-        md_content.append(f"# {pdf_name.replace('.pdf', '').replace('_', ' ').title()}")
-        md_content.append("")
+        yield f"# {pdf_name.replace('.pdf', '').replace('_', ' ').title()}"
+        yield ""
+    
+    def _iter_page_markdown(self, page_data: Dict[str, Any]) -> Iterator[str]:
+        """Yield the markdown lines for a single page"""
+        page_num = page_data['page_num'] + 1  # Convert to 1-based for display
         
-        # Process each page
-        for page_data in extracted_data:
-            page_num = page_data['page_num'] + 1  # Convert to 1-based for display
-            
-            # Add page identifier (minimal)
-            md_content.append(f"**Page {page_num}**")
-            md_content.append("")
-            
-            # Add the cleaned text content
-            if page_data['ocr_text']:
-                md_content.append(page_data['ocr_text'])
-            else:
-                md_content.append("*No text could be extracted from this page*")
-            
-            md_content.append("")
-            md_content.append("---")
-            md_content.append("")
+        # Add page identifier (minimal)
+        yield f"**Page {page_num}**"
+        yield ""
+        
+        # Add the cleaned text content
+        if page_data['ocr_text']:
+            yield page_data['ocr_text']
+        else:
+            yield "*No text could be extracted from this page*"
+        
+        yield ""
+        yield "---"
+        yield ""
+    
+    def _iter_extracted_pages(
+        self,
+        doc: fitz.Document,
+        pdf_path: Path,
+        page_nums: List[int],
+        dpi: int
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield extracted page data in page_nums order, as soon as each page is ready"""
+        if self._pool is None or len(page_nums) <= 1:
+            for i in range(0, len(page_nums), OCR_BATCH_PAGES):
+                batch = page_nums[i:i + OCR_BATCH_PAGES]
+                yield from self.extract_page_batch(doc, pdf_path.stem, batch, dpi)
+            return
         
-        return '\n'.join(md_content)
+        # Pages are independent, so OCR them in parallel worker processes.
+        # Each worker gets a contiguous run of pages and opens the PDF once for it.
+        chunk_size = -(-len(page_nums) // self.workers)
+        chunks = [page_nums[i:i + chunk_size] for i in range(0, len(page_nums), chunk_size)]
+        futures = {
+            self._pool.submit(self.extract_pages, str(pdf_path), chunk, dpi): index
+            for index, chunk in enumerate(chunks)
+        }
+        
+        try:
+            # Hold back chunks that finish early until every chunk before them is out
+            finished = {}
+            next_index = 0
+            for future in as_completed(futures):
+                finished[futures[future]] = future.result()
+                while next_index in finished:
+                    yield from finished.pop(next_index)
+                    next_index += 1
+        finally:
+            # The pool outlives this conversion, so drop work nobody will collect
+            for future in futures:
+                future.cancel()
     
     def convert_pdf_to_markdown(
         self,
         pdf_path: str,
         output_filename: Optional[str] = None,
         pages: Optional[List[int]] = None,
-        dpi: int = 300
+        dpi: int = 200
     ) -> Dict[str, Any]:
         """
         Convert PDF to clean Markdown using improved OCR
@@ -406,43 +1090,56 @@ class ImprovedOCRConverter:
         logger.info(f"Image DPI: {dpi}")
         logger.info(f"Using improved OCR with watermark removal and text cleaning")
         
+        doc = None
         try:
-            # Open PDF to get total page count
+            # Open the PDF once; sequential extraction reuses this document
             doc = fitz.open(str(pdf_path))
             total_pages = len(doc)
-            doc.close()
             
             if pages is None:
                 pages = list(range(total_pages))
             
             logger.info(f"Processing {len(pages)} pages...")
             
-            # Extract each page with improved OCR
-            extracted_data = []
+            valid_pages = []
             for page_num in pages:
                 if page_num >= total_pages:
                     logger.warning(f"Skipping page {page_num} (PDF only has {total_pages} pages)")
                     continue
-                
-                page_data = self.extract_page_with_improved_ocr(str(pdf_path), page_num, dpi)
-                extracted_data.append(page_data)
-            
-            # Create clean markdown
-            md_content = self.create_clean_markdown(extracted_data, pdf_path.name)
+                valid_pages.append(page_num)
             
-            # Save the markdown
             output_name = output_filename or pdf_path.stem
             output_file = self.output_dir / f"{output_name}_clean.md"
-            output_file.write_text(md_content, encoding='utf-8')
             
-            # Count pages with successful text extraction
-            pages_with_text = sum(1 for p in extracted_data if p['has_text'])
+            # Extract each page with improved OCR and stream its markdown straight
+            # to a temporary file, so only the pages in flight are held in memory.
+            # It replaces the output file only once every page is written, so a
+            # failed run never truncates an earlier result or leaves a partial file.
+            tmp_file = output_file.with_name(f"{output_file.name}.{os.getpid()}.tmp")
+            extracted_pages = 0
+            pages_with_text = 0
+            try:
+                # Each page is encoded to UTF-8 once and handed to a large write buffer,
+                # instead of going through the text layer line by line
+                with tmp_file.open('wb', buffering=OUTPUT_BUFFER_SIZE) as f:
+                    f.write(_encode_markdown_lines(self._iter_markdown_header(pdf_path.name)))
+                    for page_data in self._iter_extracted_pages(doc, pdf_path, valid_pages, dpi):
+                        f.write(_encode_markdown_lines(self._iter_page_markdown(page_data)))
+                        
+                        # Count pages with successful text extraction
+                        extracted_pages += 1
+                        if page_data['has_text']:
+                            pages_with_text += 1
+                
+                os.replace(tmp_file, output_file)
+            finally:
+                tmp_file.unlink(missing_ok=True)
             
             return {
                 'success': True,
                 'method': 'improved_ocr',
                 'output_file': str(output_file),
-                'extracted_pages': len(extracted_data),
+                'extracted_pages': extracted_pages,
                 'pages_with_text': pages_with_text,
                 'total_pages': total_pages
             }
@@ -454,6 +1151,10 @@ class ImprovedOCRConverter:
                 'error': str(e),
                 'method': 'failed'
             }
+        
+        finally:
+            if doc is not None:
+                doc.close()
 
 def main():
     """Main function for command-line usage"""
@@ -498,6 +1199,12 @@ Examples:
         help='Directory for extracted images (default: improved_images)'
     )
     
+    parser.add_argument(
+        '--save-images',
+        action='store_true',
+        help='Save rendered page images to the image directory'
+    )
+    
     parser.add_argument(
         '--pages',
         type=int,
@@ -508,8 +1215,35 @@ Examples:
     parser.add_argument(
         '--dpi',
         type=int,
-        default=300,
-        help='Resolution for extracted images (default: 300)'
+        default=200,
+        help='Resolution for extracted images (default: 200)'
+    )
+    
+    parser.add_argument(
+        '--margins',
+        type=float,
+        nargs=4,
+        metavar=('LEFT', 'TOP', 'RIGHT', 'BOTTOM'),
+        default=DEFAULT_OCR_MARGINS,
+        help='Page borders to skip during OCR, as fractions of the page size (default: 0.05 0.04 0.05 0.06)'
+    )
+    
+    parser.add_argument(
+        '--force-ocr',
+        action='store_true',
+        help='OCR every page, even pages that already have a text layer'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always run OCR instead of reusing cached results from earlier runs'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Number of parallel OCR worker processes (default: CPU count, up to 4)'
     )
     
     parser.add_argument(
@@ -524,17 +1258,21 @@ Examples:
         logging.getLogger().setLevel(logging.DEBUG)
     
     try:
-        converter = ImprovedOCRConverter(
+        with ImprovedOCRConverter(
             output_dir=args.output_dir,
-            image_dir=args.image_dir
-        )
-        
-        result = converter.convert_pdf_to_markdown(
-            args.input,
-            output_filename=args.output_name,
-            pages=args.pages,
-            dpi=args.dpi
-        )
+            image_dir=args.image_dir,
+            save_images=args.save_images,
+            force_ocr=args.force_ocr,
+            use_cache=not args.no_cache,
+            margins=tuple(args.margins),
+            workers=args.workers
+        ) as converter:
+            result = converter.convert_pdf_to_markdown(
+                args.input,
+                output_filename=args.output_name,
+                pages=args.pages,
+                dpi=args.dpi
+            )
         
         if result['success']:
             logger.info("Improved OCR conversion completed successfully!")